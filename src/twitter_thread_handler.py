@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Twitter/X thread handler that fetches full threads via Thread Reader App
+and saves them as raw transcripts for the processing pipeline.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+
+logger = logging.getLogger(__name__)
+
+# Precompiled once at import so the hot-path calls skip re's cache lookup
+_TWITTER_URL_RE = re.compile(r'https?://(www\.)?(twitter\.com|x\.com)/.+/status/\d+')
+_TWEET_ID_RE = re.compile(r'/status/(\d+)')
+_USERNAME_RE = re.compile(r'/(\w+)/status/')
+_URL_STRIP_RE = re.compile(r'https?://\S+')
+_THREAD_MARKER_RE = re.compile(r'\(thread\)|\[thread\]', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENT_SPLIT_RE = re.compile(r'[.!?]\s+')
+
+# Posted threads are effectively immutable, so cached pages stay valid a long time
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Twitter Snowflake epoch (2010-11-04T01:42:54.657Z) in milliseconds
+TWITTER_EPOCH_MS = 1288834974657
+
+class TwitterThreadHandler:
+    def __init__(self, base_dir=None):
+        """Initialize the handler with base directory for transcript output."""
+        if base_dir is None:
+            current_file = os.path.abspath(__file__)
+            base_dir = os.path.dirname(os.path.dirname(current_file))
+
+        self.base_dir = Path(base_dir)
+        self.raw_dir = self.base_dir / "transcript" / "raw"
+        self.cache_dir = self.base_dir / "transcript" / "cache" / "twitter"
+        for directory in [self.raw_dir, self.cache_dir]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # One pooled session for all fetches: keep-alive and TLS session
+        # reuse save a full handshake per thread when processing batches
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept': 'text/html'
+        })
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def _read_cached_page(self, tweet_id):
+        """Return the cached Thread Reader page for a tweet ID, or None."""
+        cache_path = self.cache_dir / f"{tweet_id}.html"
+        try:
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL_SECONDS:
+                logger.info("📦 Using cached thread page: %s", cache_path.name)
+                return cache_path.read_bytes()
+        except OSError as e:
+            logger.warning("⚠️  Could not read cache file: %s", e)
+        return None
+
+    def _write_cached_page(self, tweet_id, page_html):
+        """Store a fetched Thread Reader page in the cache."""
+        cache_path = self.cache_dir / f"{tweet_id}.html"
+        try:
+            cache_path.write_bytes(page_html)
+        except OSError as e:
+            logger.warning("⚠️  Could not write cache file: %s", e)
+
+    def is_twitter_url(self, url):
+        """Check if a URL points to a tweet on twitter.com or x.com."""
+        if not url:
+            return False
+        # Cheap substring test first: most non-Twitter URLs are rejected
+        # without ever running the regex
+        if 'twitter.com' not in url and 'x.com' not in url:
+            return False
+        return _TWITTER_URL_RE.match(url) is not None
+
+    def extract_tweet_id(self, url):
+        """Extract the numeric tweet ID from a tweet URL."""
+        match = _TWEET_ID_RE.search(url)
+        return match.group(1) if match else None
+
+    def extract_username(self, url):
+        """Extract the username from a tweet URL."""
+        match = _USERNAME_RE.search(url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def snowflake_to_iso(tweet_id_int):
+        """Decode a Snowflake tweet ID to an ISO 8601 UTC timestamp string."""
+        # Top bits are milliseconds since the Twitter epoch; format via
+        # time.gmtime directly, which is much cheaper than building a datetime
+        ms = (tweet_id_int >> 22) + TWITTER_EPOCH_MS
+        s, frac = divmod(ms, 1000)
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(s)) + f'.{frac:03d}'
+
+    def get_tweet_date(self, tweet_id):
+        """Return the tweet creation date as an ISO string, or None."""
+        try:
+            tweet_date = self.snowflake_to_iso(int(tweet_id))
+            logger.debug("📅 Tweet date: %s", tweet_date[:10])
+            return tweet_date
+        except (ValueError, OSError):
+            return None
+
+    def infer_title_from_content(self, thread_content, username):
+        """Infer a page title from the first tweet of the thread."""
+        # Only the first tweet matters; avoid splitting the whole thread
+        idx = thread_content.find('\n\n')
+        first_tweet = thread_content[:idx] if idx != -1 else thread_content
+
+        # Strip URLs and thread markers, they never belong in a title
+        first_tweet = _URL_STRIP_RE.sub('', first_tweet)
+        first_tweet = _THREAD_MARKER_RE.sub('', first_tweet)
+        first_tweet = _WHITESPACE_RE.sub(' ', first_tweet).strip()
+
+        # Use the first sentence if it is a reasonable length
+        title = _SENT_SPLIT_RE.split(first_tweet, maxsplit=1)[0].strip()
+
+        if len(title) > 100:
+            title = title[:97] + '...'
+        if not title:
+            title = f"Twitter thread by @{username}"
+
+        return title
+
+    def fetch_thread_content(self, url):
+        """
+        Fetch a full Twitter/X thread as plain text.
+
+        Args:
+            url (str): Tweet URL (twitter.com or x.com)
+
+        Returns:
+            tuple: (success, transcript_file_path, thread_info)
+        """
+        if not self.is_twitter_url(url):
+            logger.error("❌ Not a Twitter/X status URL: %s", url)
+            return False, None, None
+
+        tweet_id = self.extract_tweet_id(url)
+        username = self.extract_username(url)
+
+        if not tweet_id or not username:
+            logger.error("❌ Could not extract tweet ID or username from: %s", url)
+            return False, None, None
+
+        return self._fetch_with_threadreader(tweet_id, username)
+
+    def _fetch_with_threadreader(self, tweet_id, username):
+        """Fetch the unrolled thread from Thread Reader App and save it."""
+        cached = self._read_cached_page(tweet_id)
+        if cached is not None:
+            return self._parse_and_save(cached, tweet_id, username)
+
+        threadreader_url = f"https://threadreaderapp.com/thread/{tweet_id}.html"
+        logger.info("📥 Fetching thread from Thread Reader App: %s", threadreader_url)
+
+        try:
+            response = self._session.get(threadreader_url, timeout=30)
+
+            if response.status_code != 200:
+                logger.error("❌ Thread Reader App returned status %s", response.status_code)
+                return False, None, None
+
+            # Work with raw bytes: Lexbor parses them directly and we skip
+            # requests' slow charset autodetection on large pages
+            page_html = response.content
+            self._write_cached_page(tweet_id, page_html)
+            return self._parse_and_save(page_html, tweet_id, username)
+
+        except requests.RequestException as e:
+            logger.error("❌ Error fetching thread: %s", e)
+            return False, None, None
+
+    def _parse_and_save(self, page_html, tweet_id, username):
+        """Extract tweet texts from a Thread Reader page (bytes) and save the thread."""
+        tree = LexborHTMLParser(page_html)
+
+        # Thread Reader App has used a few different markups over time;
+        # one combined selector finds any of them in a single tree walk
+        elements = tree.css('div.tweet-text, div.content-tweet, p.tweet, div.t-main')
+        if elements:
+            logger.debug("🔍 Found %d tweet elements", len(elements))
+        else:
+            # Fallback: grab paragraphs from the main content area
+            elements = tree.css('div.content p')
+
+        # Stream each tweet straight to disk instead of joining the whole
+        # thread in memory; only the first tweet is kept for title inference
+        tweet_count = 0
+        first_tweet = ''
+        file_path = self.raw_dir / f"{username}_{tweet_id}.txt"
+        with open(file_path, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+            for elem in elements:
+                text = elem.text(strip=True)
+                if text and len(text) > 20:
+                    if tweet_count:
+                        f.write('\n\n')
+                    else:
+                        first_tweet = text
+                    f.write(text)
+                    tweet_count += 1
+
+        if not tweet_count:
+            logger.error("❌ No tweet content found in Thread Reader App page")
+            file_path.unlink(missing_ok=True)
+            return False, None, None
+
+        logger.info("✅ Extracted %d tweets from thread", tweet_count)
+
+        title = self.infer_title_from_content(first_tweet, username)
+        logger.info("📝 Title: %s", title)
+
+        tweet_date = self.get_tweet_date(tweet_id)
+
+        logger.info("💾 Saved thread to: %s", file_path)
+
+        thread_info = {
+            'title': title,
+            'uploader': f"@{username}",
+            'upload_date': tweet_date if tweet_date else 'Unknown',
+            'tweet_count': tweet_count,
+            'webpage_url': f"https://twitter.com/{username}/status/{tweet_id}"
+        }
+
+        return True, str(file_path), thread_info
+
+    async def fetch_thread_content_async(self, url, session=None):
+        """
+        Async version of fetch_thread_content for use inside an event loop.
+
+        Args:
+            url (str): Tweet URL (twitter.com or x.com)
+            session: Optional shared aiohttp.ClientSession
+
+        Returns:
+            tuple: (success, transcript_file_path, thread_info)
+        """
+        import aiohttp
+
+        if not self.is_twitter_url(url):
+            logger.error("❌ Not a Twitter/X status URL: %s", url)
+            return False, None, None
+
+        tweet_id = self.extract_tweet_id(url)
+        username = self.extract_username(url)
+
+        if not tweet_id or not username:
+            logger.error("❌ Could not extract tweet ID or username from: %s", url)
+            return False, None, None
+
+        if session is not None:
+            return await self._fetch_one(session, tweet_id, username)
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'Accept-Encoding': 'gzip, deflate',
+                'Accept': 'text/html'
+            }
+        ) as own_session:
+            return await self._fetch_one(own_session, tweet_id, username)
+
+    async def fetch_many(self, urls):
+        """
+        Fetch several threads concurrently over one shared connection pool.
+
+        Args:
+            urls (list): Tweet URLs to fetch
+
+        Returns:
+            list: One (success, transcript_file_path, thread_info) tuple per URL
+        """
+        import aiohttp
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'Accept-Encoding': 'gzip, deflate',
+                'Accept': 'text/html'
+            }
+        ) as session:
+            return await asyncio.gather(
+                *[self.fetch_thread_content_async(url, session=session) for url in urls]
+            )
+
+    async def _fetch_one(self, session, tweet_id, username):
+        """Fetch one thread over the shared aiohttp session and parse it off-loop."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+
+        cached = self._read_cached_page(tweet_id)
+        if cached is not None:
+            return await loop.run_in_executor(None, self._parse_and_save, cached, tweet_id, username)
+
+        threadreader_url = f"https://threadreaderapp.com/thread/{tweet_id}.html"
+        logger.info("📥 Fetching thread from Thread Reader App: %s", threadreader_url)
+
+        try:
+            async with session.get(threadreader_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status != 200:
+                    logger.error("❌ Thread Reader App returned status %s", response.status)
+                    return False, None, None
+                page_html = await response.read()
+
+            self._write_cached_page(tweet_id, page_html)
+
+            # Parsing is CPU-bound; run it in the default executor so the
+            # event loop stays free to drive the other fetches
+            return await loop.run_in_executor(None, self._parse_and_save, page_html, tweet_id, username)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("❌ Error fetching thread: %s", e)
+            return False, None, None
+
+def main():
+    """Command line usage."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if len(sys.argv) < 2:
+        print("Usage: python twitter_thread_handler.py <tweet_url> [tweet_url ...]")
+        print("Example: python twitter_thread_handler.py 'https://twitter.com/user/status/1234567890'")
+        sys.exit(1)
+
+    handler = TwitterThreadHandler()
+    urls = sys.argv[1:]
+
+    if len(urls) > 1:
+        results = asyncio.run(handler.fetch_many(urls))
+    else:
+        results = [handler.fetch_thread_content(urls[0])]
+
+    failed = 0
+    for success, file_path, thread_info in results:
+        if success:
+            print(f"✅ Thread saved: {file_path}")
+            print(f"📝 Title: {thread_info['title']}")
+        else:
+            failed += 1
+
+    if failed:
+        print(f"❌ Failed to fetch {failed} of {len(urls)} threads")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()